@@ -9,18 +9,33 @@ try:
 
     from . import jinja_filters
 
-    # Store the original __init__ method
-    _original_env_init = Environment.__init__
+    # Replace the __init__ method, unless a previous import already did
+    # (re-imports must not stack wrappers or recapture the patched method)
+    if not getattr(Environment.__init__, "_arranger_filters", False):
+        # Store the original __init__ method
+        _original_env_init = Environment.__init__
 
-    def _patched_env_init(self: Any, *args: Any, **kwargs: Any) -> None:
-        """Patched Environment.__init__ to register custom filters."""
-        # Call original init
-        _original_env_init(self, *args, **kwargs)
-        # Add custom filters after initialization
-        self.filters.update(jinja_filters.FILTERS)
+        # The original init and filter registry are bound as default arguments:
+        # locals resolve faster than module globals on every Environment
+        # construction, and the wrapper keeps working even if the module
+        # globals are later rebound (e.g. by a reload).
+        def _patched_env_init(
+            self: Any,
+            *args: Any,
+            _orig: Any = _original_env_init,
+            _filters: Any = jinja_filters.FILTERS,
+            **kwargs: Any,
+        ) -> None:
+            """Patched Environment.__init__ to register custom filters."""
+            # Call original init
+            _orig(self, *args, **kwargs)
+            # Add custom filters after initialization; skip the dict update
+            # when they are already registered (shared/overlayed mappings)
+            if "read_file" not in self.filters:
+                self.filters.update(_filters)
 
-    # Replace the __init__ method
-    Environment.__init__ = _patched_env_init
+        _patched_env_init._arranger_filters = True  # type: ignore[attr-defined]
+        Environment.__init__ = _patched_env_init  # type: ignore[method-assign]
 
 except ImportError:
     # Jinja2 not available, skip patching
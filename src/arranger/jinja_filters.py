@@ -4,8 +4,43 @@ These filters extend Jinja2 with file system operations needed by the templates.
 To use in PSR, these must be registered before template rendering.
 """
 
+import os
 from pathlib import Path
-from typing import Union
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple, Union
+
+# Cache of file contents keyed by path, validated against (mtime_ns, size).
+# Templates read the same files (CHANGELOG.md, addon.xml) repeatedly during a
+# render pass; a stale entry is detected by the stat key and re-read.
+_read_cache: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+
+def _read_cached(file_path: Union[str, Path]) -> str:
+    """Read file contents through the (path, mtime, size)-validated cache.
+
+    Args:
+        file_path: Path to file to read (string or Path object)
+
+    Returns:
+        File contents as string
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+    """
+    path_str = os.fspath(file_path)
+    stat_result = os.stat(path_str)
+    stat_key = (stat_result.st_mtime_ns, stat_result.st_size)
+
+    cached = _read_cache.get(path_str)
+    if cached is not None and cached[0] == stat_key:
+        return cached[1]
+
+    # Plain open() on the already-normalized string path: constructing a Path
+    # just to call read_text() adds parsing overhead for no benefit here
+    with open(path_str, "r") as f:
+        content = f.read()
+    _read_cache[path_str] = (stat_key, content)
+    return content
 
 
 def read_file(file_path: Union[str, Path]) -> str:
@@ -20,7 +55,7 @@ def read_file(file_path: Union[str, Path]) -> str:
     Raises:
         FileNotFoundError: If file doesn't exist
     """
-    return Path(file_path).read_text()
+    return _read_cached(file_path)
 
 
 def read_file_or_empty(file_path: Union[str, Path]) -> str:
@@ -36,7 +71,7 @@ def read_file_or_empty(file_path: Union[str, Path]) -> str:
         File contents as string, or empty string if file doesn't exist
     """
     try:
-        return Path(file_path).read_text()
+        return _read_cached(file_path)
     except FileNotFoundError:
         return ""
 
@@ -53,9 +88,13 @@ def file_exists(file_path: Union[str, Path]) -> bool:
     return Path(file_path).exists()
 
 
-# Export filter dictionary for easy registration with Jinja2 Environment
-FILTERS = {
-    "read_file": read_file,
-    "read_file_or_empty": read_file_or_empty,
-    "file_exists": file_exists,
-}
+# Export filter mapping for easy registration with Jinja2 Environment.
+# Read-only view: the registry is shared across every Environment, so an
+# accidental mutation in one place must not leak into all renders.
+FILTERS: Mapping[str, object] = MappingProxyType(
+    {
+        "read_file": read_file,
+        "read_file_or_empty": read_file_or_empty,
+        "file_exists": file_exists,
+    }
+)
@@ -33,26 +33,107 @@ Configuration (in pyproject.toml):
 
 from __future__ import annotations
 
-import argparse
-import importlib.resources
+import json
+import os
+import re
 import sys
-import tomllib
-import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple, cast
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Tuple, cast
+
+if TYPE_CHECKING:
+    import argparse
 
 # Module constants (C3.6)
 TEMPLATES_PACKAGE = "arranger.templates"
+CONFIG_CACHE_SUFFIX = ".toml.cache"
 DEFAULT_TEMPLATES_DIR = "templates"
 DEFAULT_CHANGELOG_DEST = "universal/CHANGELOG.md.j2"
 DEFAULT_KODI_ADDON_DEST = "kodi-addons/addon.xml.j2"
-VALID_CONFIG_KEYS = {
-    "templates-dir",
-    "use-default-pypi-structure",
-    "use-default-kodi-addon-structure",
-    "kodi-addon-directory",
-    "source-mappings",
-}
+# A destination must contain a directory separator that is not just a
+# trailing slash, i.e. a "/" with a non-slash character somewhere after it
+_DEST_DIR_RE = re.compile(r"/.*[^/]")
+VALID_CONFIG_KEYS = frozenset(
+    {
+        "templates-dir",
+        "use-default-pypi-structure",
+        "use-default-kodi-addon-structure",
+        "kodi-addon-directory",
+        "source-mappings",
+    }
+)
+
+
+def _config_cache_key(pyproject_path: Path) -> Optional[Tuple[int, int]]:
+    """
+    Build the cache invalidation key for a pyproject.toml file.
+
+    Args:
+        pyproject_path: Path to pyproject.toml file.
+
+    Returns:
+        Tuple of (st_mtime_ns, st_size) for the file, or None if the file
+        cannot be stat'd (caching is skipped in that case).
+    """
+    try:
+        stat_result = os.stat(pyproject_path)
+    except OSError:
+        return None
+    return (stat_result.st_mtime_ns, stat_result.st_size)
+
+
+def _load_config_cache(cache_path: Path, cache_key: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+    """
+    Load a previously cached [tool.arranger] section if it is still valid.
+
+    The cache is a JSON document of [cache_key, config_dict]. JSON is used
+    deliberately instead of pickle: the cache sits in the user's project
+    directory, and unpickling a file anyone can write is arbitrary code
+    execution, while the [tool.arranger] section is plain TOML data that
+    round-trips through JSON. A stale, missing, or unreadable cache simply
+    returns None so the caller falls back to parsing the TOML file.
+
+    Args:
+        cache_path: Path to the cache file next to pyproject.toml.
+        cache_key: Expected (st_mtime_ns, st_size) key for the source file.
+
+    Returns:
+        Cached configuration dictionary, or None if the cache is unusable.
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key, config = json.load(f)
+    except (OSError, ValueError, TypeError):
+        return None
+
+    if cached_key != list(cache_key) or not isinstance(config, dict):
+        return None
+    return config
+
+
+def _store_config_cache(cache_path: Path, cache_key: Tuple[int, int], config: Dict[str, Any]) -> None:
+    """
+    Write the parsed [tool.arranger] section to the cache atomically.
+
+    Writes to a temporary file and renames it into place with os.replace so
+    concurrent readers never observe a partial cache. Failures are ignored:
+    the cache is purely an optimization.
+
+    Args:
+        cache_path: Path to the cache file next to pyproject.toml.
+        cache_key: (st_mtime_ns, st_size) key for the source file.
+        config: Parsed [tool.arranger] dictionary to cache.
+    """
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump([cache_key, config], f, separators=(",", ":"))
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
 
 
 def load_config(pyproject_path: Path) -> Dict[str, Any]:
@@ -87,23 +168,53 @@ def load_config(pyproject_path: Path) -> Dict[str, Any]:
             "Please ensure you run this command from the project root directory."
         )
 
-    try:
-        with open(pyproject_path, "rb") as f:
-            data: Dict[str, Any] = tomllib.load(f)
-    except tomllib.TOMLDecodeError as e:
-        raise ValueError(
-            f"Invalid TOML syntax in {pyproject_path}: {str(e)}\n" "Please check the file for syntax errors."
-        ) from e
-    except Exception as e:
-        raise ValueError(f"Failed to read {pyproject_path}: {str(e)}") from e
+    # Warm-run fast path: reuse the cached [tool.arranger] section as long as
+    # the TOML file's (mtime, size) key has not changed. Parsing is the
+    # dominant startup cost for repeat invocations.
+    cache_key = _config_cache_key(pyproject_path)
+    cache_path = pyproject_path.with_suffix(CONFIG_CACHE_SUFFIX)
+    config: Optional[Dict[str, Any]] = None
+    if cache_key is not None:
+        config = _load_config_cache(cache_path, cache_key)
+
+    if config is None:
+        # Imported here, not at module scope: warm runs served from the config
+        # cache never need the TOML parser at all
+        try:
+            import tomllib
+        except ModuleNotFoundError:  # Python < 3.11; tomli is declared for these versions
+            import tomli as tomllib
 
-    config: Dict[str, Any] = cast(Dict[str, Any], data.get("tool", {}).get("arranger", {}))
+        try:
+            with open(pyproject_path, "rb") as f:
+                raw = f.read()
+            # Cheap substring prefilter: a pyproject.toml that never mentions
+            # "arranger" cannot contain a [tool.arranger] table, so skip the
+            # full TOML parse entirely.
+            if b"arranger" not in raw:
+                data: Dict[str, Any] = {}
+            else:
+                # Parse the in-memory bytes directly; loads() on one
+                # contiguous buffer beats tomllib streaming small reads
+                # from the file object.
+                data = tomllib.loads(raw.decode("utf-8"))
+        except tomllib.TOMLDecodeError as e:
+            raise ValueError(
+                f"Invalid TOML syntax in {pyproject_path}: {str(e)}\n" "Please check the file for syntax errors."
+            ) from e
+        except Exception as e:
+            raise ValueError(f"Failed to read {pyproject_path}: {str(e)}") from e
+
+        config = cast(Dict[str, Any], data.get("tool", {}).get("arranger", {}))
+        if cache_key is not None:
+            _store_config_cache(cache_path, cache_key, config)
     # Set defaults
     config.setdefault("source-mappings", {})
 
-    # Warn about unknown config keys (E1.6 - partial)
-    unknown_keys = set(config.keys()) - VALID_CONFIG_KEYS
-    if unknown_keys:
+    # Warn about unknown config keys (E1.6 - partial); the issuperset probe
+    # avoids building a difference set in the usual all-keys-valid case
+    if not VALID_CONFIG_KEYS.issuperset(config.keys()):
+        unknown_keys = config.keys() - VALID_CONFIG_KEYS
         print(
             f"Warning: Unknown keys in [tool.arranger]: {', '.join(sorted(unknown_keys))}",
             file=sys.stderr,
@@ -112,15 +223,18 @@ def load_config(pyproject_path: Path) -> Dict[str, Any]:
     return config
 
 
-def _validate_config_types(config: Dict[str, Any]) -> None:
+def _validate_config(config: Dict[str, Any]) -> None:
     """
-    Validate that configuration values have correct types.
+    Validate entire configuration for correctness.
+
+    Runs type and value validation in a single pass: each configured key is
+    looked up once, type-checked, and then checked for meaningful values.
 
     Args:
         config: Configuration dictionary from [tool.arranger].
 
     Raises:
-        ValueError: If configuration values have incorrect types.
+        ValueError: If configuration is invalid.
     """
     # Define expected types for each configuration key
     expected_types = {
@@ -132,72 +246,39 @@ def _validate_config_types(config: Dict[str, Any]) -> None:
     }
 
     for key, expected_type in expected_types.items():
-        if key in config:
-            value = config[key]
-            if not isinstance(value, expected_type):
-                raise ValueError(
-                    f"Invalid type for config key '{key}': expected {expected_type.__name__}, "
-                    f"got {type(value).__name__}\n"
-                    f"Please ensure '{key}' is configured as: {expected_type.__name__.lower()}"
-                )
-
-
-def _validate_config_values(config: Dict[str, Any]) -> None:
-    """
-    Validate that configuration values are valid and meaningful.
-
-    Args:
-        config: Configuration dictionary from [tool.arranger].
-
-    Raises:
-        ValueError: If configuration values are invalid.
-    """
-    # Validate templates-dir
-    templates_dir = config.get("templates-dir")
-    if templates_dir is not None:
-        if not templates_dir:
-            raise ValueError("Configuration error: 'templates-dir' cannot be an empty string.")
-
-        if "/" in templates_dir or "\\" in templates_dir:
+        if key not in config:
+            continue
+        value: Any = config[key]
+        if not isinstance(value, expected_type):
             raise ValueError(
-                f"Configuration error: 'templates-dir' should be a simple directory name, "
-                f"not a path: '{templates_dir}'\n"
-                f"Use 'templates-dir = \"mytemplates\"' instead of 'templates-dir = \"path/to/mytemplates\"'"
+                f"Invalid type for config key '{key}': expected {expected_type.__name__}, "
+                f"got {type(value).__name__}\n"
+                f"Please ensure '{key}' is configured as: {expected_type.__name__.lower()}"
             )
-
-    # Validate kodi-addon-directory
-    kodi_addon_directory = config.get("kodi-addon-directory")
-    if kodi_addon_directory is not None and not kodi_addon_directory:
-        raise ValueError("Configuration error: 'kodi-addon-directory' cannot be an empty string.")
-
-    # Validate source-mappings is a valid dictionary
-    source_mappings = config.get("source-mappings", {})
-    if not isinstance(source_mappings, dict):
-        type_name = type(source_mappings).__name__
-        raise ValueError(f"Configuration error: 'source-mappings' must be a dictionary, got {type_name}")
-
-    for dest, template_path in source_mappings.items():
-        if not isinstance(dest, str) or not isinstance(template_path, str):
-            raise ValueError(
-                f"Configuration error: All source-mappings keys and values must be strings.\n"
-                f"Entry '{dest}' has invalid type(s)."
-            )
-
-
-def _validate_config(config: Dict[str, Any]) -> None:
-    """
-    Validate entire configuration for correctness.
-
-    Runs type and value validation on the configuration dictionary.
-
-    Args:
-        config: Configuration dictionary from [tool.arranger].
-
-    Raises:
-        ValueError: If configuration is invalid.
-    """
-    _validate_config_types(config)
-    _validate_config_values(config)
+        # Re-fetch to undo the isinstance narrowing: the heterogeneous
+        # expected_types values join to type[object], so mypy would otherwise
+        # treat value as object in the per-key checks below
+        value = config[key]
+
+        if key == "templates-dir":
+            if not value:
+                raise ValueError("Configuration error: 'templates-dir' cannot be an empty string.")
+            if "/" in value or "\\" in value:
+                raise ValueError(
+                    f"Configuration error: 'templates-dir' should be a simple directory name, "
+                    f"not a path: '{value}'\n"
+                    f"Use 'templates-dir = \"mytemplates\"' instead of 'templates-dir = \"path/to/mytemplates\"'"
+                )
+        elif key == "kodi-addon-directory":
+            if not value:
+                raise ValueError("Configuration error: 'kodi-addon-directory' cannot be an empty string.")
+        elif key == "source-mappings":
+            for dest, template_path in value.items():
+                if not isinstance(dest, str) or not isinstance(template_path, str):
+                    raise ValueError(
+                        f"Configuration error: All source-mappings keys and values must be strings.\n"
+                        f"Entry '{dest}' has invalid type(s)."
+                    )
 
 
 def _validate_flag_exclusivity(args: argparse.Namespace) -> None:
@@ -210,7 +291,7 @@ def _validate_flag_exclusivity(args: argparse.Namespace) -> None:
     Raises:
         ValueError: If more than one of --pypi, --kodi-addon, --changelog-only is set.
     """
-    flag_count = sum([args.pypi, args.kodi_addon, args.changelog_only])
+    flag_count = args.pypi + args.kodi_addon + args.changelog_only
     if flag_count > 1:
         raise ValueError(
             "Flags --pypi, --kodi-addon, and --changelog-only are mutually exclusive.\n"
@@ -225,35 +306,53 @@ def _set_default_flag(args: argparse.Namespace) -> None:
     Args:
         args: Parsed command-line arguments (modified in-place).
     """
-    flag_count = sum([args.pypi, args.kodi_addon, args.changelog_only])
-    if flag_count == 0:
+    if not (args.pypi or args.kodi_addon or args.changelog_only):
         args.changelog_only = True
 
 
+# Default mappings memoized by their inputs; see _build_default_mappings
+_default_mappings_cache: Dict[Tuple[str, bool, bool, Optional[str]], Dict[str, str]] = {}
+
+
 def _build_default_mappings(
     config: Dict[str, Any],
     args: argparse.Namespace,
-) -> Tuple[Dict[str, str], set[str]]:
+) -> Dict[str, str]:
     """
-    Build default mappings for project types and return reserved destinations.
+    Build default mappings for project types.
+
+    The returned dict doubles as the reserved-destination lookup for custom
+    mapping validation; membership tests on it are O(1) without snapshotting
+    the keys into a separate set.
 
     Args:
         config: Configuration dictionary from [tool.arranger].
         args: Parsed command-line arguments.
 
     Returns:
-        Tuple of (mappings dict, set of reserved destination paths).
+        Mappings dict. Callers receive a fresh copy and may mutate it freely.
     """
-    mappings: Dict[str, str] = {}
+    # Pull config keys into locals once instead of repeating dict lookups
     templates_dir = config.get("templates-dir", DEFAULT_TEMPLATES_DIR)
+    use_pypi = config.get("use-default-pypi-structure")
+    use_kodi = config.get("use-default-kodi-addon-structure")
+    kodi_addon_directory = config.get("kodi-addon-directory")
+
+    # The defaults are a pure function of these inputs; memoize so repeated
+    # invocations (programmatic use, test suites) skip the f-string rebuilds
+    cache_key = (templates_dir, bool(args.pypi or use_pypi), bool(args.kodi_addon or use_kodi), kodi_addon_directory)
+    cached = _default_mappings_cache.get(cache_key)
+    if cached is not None:
+        return dict(cached)
+
+    mappings: Dict[str, str] = {}
 
     # Build default mappings based on flags or config
-    if args.pypi or config.get("use-default-pypi-structure"):  # pragma: no cover
+    if args.pypi or use_pypi:  # pragma: no cover
         # TODO: Add PyPI defaults
         pass
 
-    if args.kodi_addon or config.get("use-default-kodi-addon-structure"):
-        kodi_addon_directory = config.get("kodi-addon-directory")
+    if args.kodi_addon or use_kodi:
         if kodi_addon_directory:
             mappings[f"{templates_dir}/{kodi_addon_directory}/addon.xml.j2"] = DEFAULT_KODI_ADDON_DEST
         else:
@@ -262,37 +361,40 @@ def _build_default_mappings(
     # Always include changelog template
     mappings[f"{templates_dir}/CHANGELOG.md.j2"] = DEFAULT_CHANGELOG_DEST
 
-    return mappings, set(mappings.keys())
+    _default_mappings_cache[cache_key] = mappings
+    return dict(mappings)
 
 
 def _validate_custom_mappings(
     source_mappings: Dict[str, str],
-    reserved_destinations: set[str],
+    reserved_destinations: Dict[str, str],
 ) -> None:
     """
     Validate custom source-mappings configuration for format and conflicts.
 
     Args:
         source_mappings: Custom mappings from config [tool.arranger].
-        reserved_destinations: Set of destination paths that cannot be overridden.
+        reserved_destinations: Default mappings whose keys cannot be overridden;
+            only membership is consulted.
 
     Raises:
         ValueError: If mapping format is invalid or conflicts with reserved destinations.
     """
     for dest, template_path in source_mappings.items():
-        # Validate destination path format
-        if not dest or "/" not in dest.rstrip("/"):
+        # Validate destination path format: one compiled-pattern scan replaces
+        # the rstrip + substring checks (also rejects the empty string)
+        if _DEST_DIR_RE.search(dest) is None:
             raise ValueError(
                 f"Invalid destination path format: '{dest}'\n"
                 "Destination paths should be file paths with at least one directory level "
                 "(e.g., 'dir/file.txt')"
             )
 
-        if dest.endswith("/"):
+        if dest[-1] == "/":
             raise ValueError(f"Destination path cannot be a directory: '{dest}'\n" "Please specify a full file path.")
 
         # Validate template path format
-        if not template_path or template_path.endswith("/"):
+        if not template_path or template_path[-1] == "/":
             raise ValueError(
                 f"Invalid template path format: '{template_path}'\n"
                 "Template paths should reference specific files, not directories."
@@ -347,12 +449,13 @@ def build_mappings(
     # Default to changelog-only if no flags specified
     _set_default_flag(args)
 
-    # Build default mappings and get reserved destination paths
-    mappings, reserved_destinations = _build_default_mappings(config, args)
+    # Build default mappings; their keys are the reserved destination paths
+    mappings = _build_default_mappings(config, args)
 
-    # E1.8: Validate custom source-mappings
+    # E1.8: Validate custom source-mappings (before the update below, so the
+    # membership check sees only the defaults)
     source_mappings = config.get("source-mappings", {})
-    _validate_custom_mappings(source_mappings, reserved_destinations)
+    _validate_custom_mappings(source_mappings, mappings)
 
     # Add validated custom mappings to result
     mappings.update(source_mappings)
@@ -392,25 +495,84 @@ def _validate_fixture_directory(fixture_dir: Path) -> Path:
         raise ValueError(f"Cannot access fixture directory {fixture_dir}: {str(e)}") from e
 
 
-def _read_template_content(templates: Any, template_path: str) -> str:
+def _create_destination_dirs(fixture_dir_abs: Path, destinations: Iterable[Path]) -> set[Path]:
+    """
+    Create every unique destination parent directory exactly once.
+
+    Destination files frequently share ancestor directories, so creating each
+    parent per file issues redundant stat/mkdir syscalls. This precomputes the
+    unique parents, creates them shallowest-first, and records each created
+    directory (including ancestors below the fixture root) so later writes can
+    skip their own mkdir call.
+
+    Args:
+        fixture_dir_abs: Absolute, already-created fixture directory.
+        destinations: Absolute destination file paths for this run.
+
+    Returns:
+        Set of directories known to exist for this run.
+
+    Raises:
+        PermissionError: If lacking permissions to create a directory.
+    """
+    created: set[Path] = set()
+    parents = {dst.parent for dst in destinations}
+
+    for parent in sorted(parents, key=lambda p: len(p.parts)):
+        if parent in created:
+            continue
+        try:
+            parent.mkdir(parents=True, exist_ok=True)
+        except PermissionError as e:
+            raise PermissionError(
+                f"Permission denied creating directory: {parent}\n"
+                "Please check that you have write permissions in this directory."
+            ) from e
+        created.add(parent)
+        # mkdir(parents=True) also created any missing ancestors
+        for ancestor in parent.parents:
+            if len(ancestor.parts) <= len(fixture_dir_abs.parts):
+                break
+            created.add(ancestor)
+
+    return created
+
+
+def _read_template_content(
+    templates: Any,
+    template_path: str,
+    content_cache: Optional[Dict[str, bytes]] = None,
+) -> bytes:
     """
     Read a template file from the templates package.
 
+    Content is read and placed as raw bytes: templates are stored as UTF-8
+    and copied verbatim, so the decode/encode round trip of text mode is
+    pure overhead. Multiple destinations commonly map to the same source
+    template, so an optional per-run cache avoids re-resolving and
+    re-reading the same resource for every destination.
+
     Args:
         templates: Templates package reference from importlib.resources.
         template_path: Relative path to template file within templates package.
+        content_cache: Optional per-run cache of template_path -> content.
 
     Returns:
-        Template file content as UTF-8 string.
+        Template file content as raw bytes (UTF-8 encoded).
 
     Raises:
         FileNotFoundError: If template file doesn't exist.
         ValueError: If template path points to a directory.
     """
+    if content_cache is not None and template_path in content_cache:
+        return content_cache[template_path]
+
     try:
         template_file: Any = templates / template_path
         try:
-            content: str = cast(str, template_file.read_text(encoding="utf-8"))
+            content: bytes = cast(bytes, template_file.read_bytes())
+            if content_cache is not None:
+                content_cache[template_path] = content
             return content
         except FileNotFoundError as e:
             raise FileNotFoundError(
@@ -459,52 +621,83 @@ def _handle_existing_destination(dst: Path, override: bool) -> None:
 
 def _write_destination_file(
     dst: Path,
-    content: str,
+    content: bytes,
     override: bool = True,
+    created_dirs: Optional[set[Path]] = None,
 ) -> None:
     """
     Write template content to destination file with proper error handling.
 
-    Creates parent directories as needed, handles existing files based on
-    override flag, and validates file encoding.
+    Creates parent directories as needed and handles existing files based on
+    the override flag. Content is written as raw bytes: templates are UTF-8
+    on disk and are copied verbatim (E1.12), so no encode step is needed.
+    Override writes go through a temporary file renamed into place, so an
+    interrupted run never leaves a half-written destination.
 
     Args:
         dst: Destination file path.
-        content: Template content to write.
+        content: Template content to write (UTF-8 encoded bytes).
         override: Whether to overwrite existing files (default: True).
+            When False, the file is opened with exclusive create so a
+            concurrent creation raises instead of being overwritten.
+        created_dirs: Optional set of directories already created this run;
+            the parent mkdir is skipped for members.
 
     Raises:
         PermissionError: If lacking permissions to write.
-        ValueError: If file encoding is invalid.
+        FileExistsError: If override=False and the destination appears.
     """
-    try:
-        dst.parent.mkdir(parents=True, exist_ok=True)
-    except PermissionError as e:
-        raise PermissionError(
-            f"Permission denied creating directory: {dst.parent}\n"
-            "Please check that you have write permissions in this directory."
-        ) from e
+    if created_dirs is None or dst.parent not in created_dirs:
+        try:
+            dst.parent.mkdir(parents=True, exist_ok=True)
+        except PermissionError as e:
+            raise PermissionError(
+                f"Permission denied creating directory: {dst.parent}\n"
+                "Please check that you have write permissions in this directory."
+            ) from e
 
     try:
-        # Explicit UTF-8 encoding (E1.12)
-        dst.write_text(content, encoding="utf-8")
+        if override:
+            # Skip the rewrite when the destination already holds exactly this
+            # content: no data changes, and the untouched mtime keeps
+            # downstream build tools from re-running on identical input.
+            try:
+                if dst.read_bytes() == content:
+                    return
+            except OSError:
+                pass
+            # Atomic replace: the content lands under a temporary name and
+            # moves into place in a single rename, so a crash mid-write can
+            # never leave a truncated destination behind.
+            tmp = dst.with_name(f"{dst.name}.{os.getpid()}.tmp")
+            tmp.write_bytes(content)
+            try:
+                tmp.replace(dst)
+            except OSError:
+                tmp.unlink(missing_ok=True)
+                raise
+        else:
+            # Exclusive create (O_CREAT|O_EXCL): the existence check and the
+            # write happen in a single open, so no separate stat is needed and
+            # a file created concurrently can never be clobbered.
+            with open(dst, "xb") as f:
+                f.write(content)
+    except FileExistsError as e:
+        raise FileExistsError(f"File exists at {dst}\n" "Use --override flag to overwrite existing files.") from e
     except PermissionError as e:
         raise PermissionError(
             f"Permission denied writing to: {dst}\n" "Please check that you have write permissions in this directory."
         ) from e
-    except UnicodeEncodeError as e:
-        raise ValueError(
-            f"File encoding error while writing {dst}: {str(e)}\n" "Ensure template content is valid UTF-8."
-        ) from e
 
 
 def _arrange_single_template(
     templates: Any,
-    fixture_dir_abs: Path,
-    dest: str,
+    dst: Path,
     template_path: str,
     override: bool,
-) -> None:
+    created_dirs: Optional[set[Path]] = None,
+    content_cache: Optional[Dict[str, bytes]] = None,
+) -> str:
     """
     Arrange a single template file from source to destination.
 
@@ -513,31 +706,29 @@ def _arrange_single_template(
 
     Args:
         templates: Templates package reference.
-        fixture_dir_abs: Absolute path to fixture directory.
-        dest: Destination path within fixture directory.
+        dst: Absolute destination file path in the fixture directory.
         template_path: Source template path in templates package.
         override: Whether to overwrite existing files.
+        created_dirs: Optional set of directories already created this run.
+        content_cache: Optional per-run cache of template_path -> content.
+
+    Returns:
+        Status line describing the placed file, for batched reporting.
 
     Raises:
         FileNotFoundError: If template cannot be found.
         ValueError: If path or encoding is invalid.
         PermissionError: If lacking required permissions.
     """
-    try:
-        content: str = _read_template_content(templates, template_path)
-
-        # Place raw template content
-        dst = fixture_dir_abs / dest
+    content: bytes = _read_template_content(templates, template_path, content_cache)
 
-        # Handle existing files/symlinks
-        _handle_existing_destination(dst, override)
+    # Handle existing files/symlinks
+    _handle_existing_destination(dst, override)
 
-        # Write the destination file
-        _write_destination_file(dst, content, override)
+    # Write the destination file
+    _write_destination_file(dst, content, override, created_dirs)
 
-        print(f"Placed {template_path} to {dst}")
-    except (FileNotFoundError, PermissionError, ValueError, IsADirectoryError) as e:
-        raise type(e)(str(e)) from e
+    return f"Placed {template_path} to {dst}"
 
 
 def _parse_addon_xml(addon_xml_path: Path) -> Optional[Dict[str, Any]]:
@@ -562,25 +753,30 @@ def _parse_addon_xml(addon_xml_path: Path) -> Optional[Dict[str, Any]]:
     if not addon_xml_path.exists():
         return None
 
+    # Imported here, not at module scope: most runs never touch addon.xml and
+    # should not pay for loading the XML machinery at startup.
+    import xml.etree.ElementTree as ET
+
     try:
-        tree = ET.parse(addon_xml_path)
-        root = tree.getroot()
-
-        # Extract addon attributes
-        metadata: Dict[str, Any] = {
-            "id": root.get("id"),
-            "name": root.get("name"),
-            "version": root.get("version"),
-            "provider-name": root.get("provider-name"),
-            "requires": [],
-        }
-
-        # Extract requires/import elements
-        requires_elem = root.find("requires")
-        if requires_elem is not None:
-            for import_elem in requires_elem.findall("import"):
-                import_info = {"addon": import_elem.get("addon"), "version": import_elem.get("version")}
-                metadata["requires"].append(import_info)
+        # Incremental parse: everything needed lives in the root element's
+        # attributes and the <requires> block, so stop as soon as </requires>
+        # closes instead of building the full tree.
+        metadata: Optional[Dict[str, Any]] = None
+        for event, elem in ET.iterparse(str(addon_xml_path), events=("start", "end")):
+            if metadata is None:
+                # First start event is the root <addon> element
+                metadata = {
+                    "id": elem.get("id"),
+                    "name": elem.get("name"),
+                    "version": elem.get("version"),
+                    "provider-name": elem.get("provider-name"),
+                    "requires": [],
+                }
+            elif event == "end" and elem.tag == "requires":
+                for import_elem in elem.findall("import"):
+                    import_info = {"addon": import_elem.get("addon"), "version": import_elem.get("version")}
+                    metadata["requires"].append(import_info)
+                break
 
         return metadata
     except ET.ParseError as e:
@@ -613,6 +809,11 @@ def _validate_addon_metadata_consistency(
         kodi_addon_directory: Directory name of Kodi addon from config or CLI arg.
         config_metadata: Addon metadata from [tool.arranger] config, if present.
     """
+    # Without config metadata there is nothing to compare against, so skip
+    # reading and parsing addon.xml altogether
+    if not config_metadata:
+        return
+
     # Determine expected addon.xml path
     addon_xml_path = fixture_dir / kodi_addon_directory / "addon.xml"
 
@@ -620,7 +821,7 @@ def _validate_addon_metadata_consistency(
     existing_metadata = _parse_addon_xml(addon_xml_path)
 
     # Only validate if both config and file exist
-    if config_metadata and existing_metadata:
+    if existing_metadata:
         mismatches = []
 
         for key in ["id", "name", "provider-name"]:
@@ -687,7 +888,10 @@ def arrange_templates(fixture_dir: Path, mappings: Dict[str, str], override: boo
             "or add [tool.arranger] configuration in pyproject.toml"
         )
 
-    # Import templates package
+    # Import templates package (importlib.resources is deferred to here so
+    # error paths that never reach the copy stage skip loading it)
+    import importlib.resources
+
     try:
         templates: Any = importlib.resources.files(TEMPLATES_PACKAGE)
     except ImportError as e:
@@ -700,34 +904,69 @@ def arrange_templates(fixture_dir: Path, mappings: Dict[str, str], override: boo
             "  pip install -e ."
         ) from e
 
-    # Arrange each template
-    for dest, template_path in mappings.items():
-        _arrange_single_template(templates, fixture_dir_abs, dest, template_path, override)
+    # Fail fast: validate every unique source before creating directories or
+    # writing files, so a missing template cannot leave the fixture directory
+    # partially arranged.
+    unique_sources = set(mappings.values())
+    missing_sources = sorted(tp for tp in unique_sources if not (templates / tp).is_file())
+    if missing_sources:
+        raise FileNotFoundError(
+            f"Template file not found: {', '.join(missing_sources)}\n"
+            f"Please ensure the template exists in the templates package.\n"
+            f"Available templates should be in: {TEMPLATES_PACKAGE}"
+        )
 
+    # Resolve destination paths once, then create all parent directories up front
+    destinations = {dest: fixture_dir_abs / dest for dest in mappings}
+    created_dirs = _create_destination_dirs(fixture_dir_abs, destinations.values())
+
+    # Per-run content cache: sources mapped to several destinations are read once.
+    # Prefilled before the pool starts when duplicates exist, so workers only
+    # ever hit the cache for shared sources.
+    content_cache: Dict[str, bytes] = {}
+    if len(unique_sources) < len(mappings):
+        for template_path in unique_sources:
+            _read_template_content(templates, template_path, content_cache)
+
+    def _arrange_one(item: Tuple[str, str]) -> str:
+        dest, template_path = item
+        return _arrange_single_template(
+            templates, destinations[dest], template_path, override, created_dirs, content_cache
+        )
 
-def main() -> None:
-    """
-    Orchestrate the template arrangement workflow.
+    # Arrange each template; independent copies are submitted concurrently so
+    # file I/O overlaps instead of serializing on each write. Status lines are
+    # collected and emitted in one batch: a print per file from worker threads
+    # would interleave and pay a syscall each.
+    if len(mappings) == 1:
+        placed = [_arrange_one(next(iter(mappings.items())))]
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, len(mappings))) as executor:
+            # list() drains the iterator so the first worker exception propagates
+            placed = list(executor.map(_arrange_one, mappings.items()))
+    print("\n".join(placed))
 
-    This is the main CLI entry point that:
-    1. Loads [tool.arranger] configuration from pyproject.toml
-    2. Parses command-line arguments for project type and options
-    3. Builds source-to-destination template mappings
-    4. Arranges templates into the fixture directory
 
-    Command-line arguments:
-      --pypi              Include default PyPI package structure templates
-      --kodi-addon        Include default Kodi addon structure templates
-      --changelog-only    Only create CHANGELOG.md template (default if no flags)
-      --override          Overwrite existing template files (default: False)
+# Parser built once and reused across main() invocations (e.g. repeated
+# programmatic calls in one process); construction dominates argparse cost.
+_parser: Optional[argparse.ArgumentParser] = None
 
-    Exit codes:
-      0 - Success: templates arranged without errors
-      1 - Failure: configuration error, file not found, or arrangement failed
 
-    Raises:
-      SystemExit: With code 1 on any uncaught error (prints to stderr)
+def _build_parser() -> argparse.ArgumentParser:
     """
+    Build (or return the cached) command-line argument parser.
+
+    Returns:
+        Configured ArgumentParser for the psr-build-template-structure CLI.
+    """
+    global _parser
+    if _parser is not None:
+        return _parser
+
+    # Imported here, not at module scope: argparse costs a few milliseconds to
+    # import and is only needed by the CLI entry point, never by library use.
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Build template structure from PSR templates.",
         epilog=(
@@ -771,7 +1010,34 @@ def main() -> None:
         help="Overwrite existing template files (default: False, raises error if files exist)",
     )
 
-    args = parser.parse_args()
+    _parser = parser
+    return parser
+
+
+def main() -> None:
+    """
+    Orchestrate the template arrangement workflow.
+
+    This is the main CLI entry point that:
+    1. Loads [tool.arranger] configuration from pyproject.toml
+    2. Parses command-line arguments for project type and options
+    3. Builds source-to-destination template mappings
+    4. Arranges templates into the fixture directory
+
+    Command-line arguments:
+      --pypi              Include default PyPI package structure templates
+      --kodi-addon        Include default Kodi addon structure templates
+      --changelog-only    Only create CHANGELOG.md template (default if no flags)
+      --override          Overwrite existing template files (default: False)
+
+    Exit codes:
+      0 - Success: templates arranged without errors
+      1 - Failure: configuration error, file not found, or arrangement failed
+
+    Raises:
+      SystemExit: With code 1 on any uncaught error (prints to stderr)
+    """
+    args = _build_parser().parse_args()
 
     try:
         pyproject_path = Path("pyproject.toml")
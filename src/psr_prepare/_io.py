@@ -0,0 +1,26 @@
+"""Small filesystem helpers shared across psr_prepare modules."""
+
+from pathlib import Path
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """Write data to path only if the current contents differ.
+
+    Skipping the write keeps mtimes stable on incremental runs, so
+    downstream tools (PSR, git) don't see files as modified when the
+    generated content is identical.
+
+    Args:
+        path: Destination file
+        data: New file contents
+
+    Returns:
+        True if the file was written, False if it was already up to date.
+    """
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.write_bytes(data)
+    return True
@@ -1,6 +1,7 @@
 """Addon.xml parsing and reconciliation."""
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 from xml.etree import ElementTree as ET
@@ -28,6 +29,10 @@ class AddonXmlData:
         self.requires: list[dict[str, str]] = []
         self.news: Optional[str] = None
         self.root: Optional[ET.Element] = None
+        # Unknown extensions collected during parse; serialized lazily and
+        # memoized on first use
+        self._unknown_extensions: Optional[list[ET.Element]] = None
+        self._unknown_extensions_xml: Optional[str] = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -52,19 +57,26 @@ class AddonXmlData:
         Returns:
             Concatenated XML strings of unknown extensions, or empty string if none.
         """
-        if not self.root:
+        if self._unknown_extensions_xml is not None:
+            return self._unknown_extensions_xml
+
+        if self._unknown_extensions is not None:
+            extensions = self._unknown_extensions
+        elif self.root is not None:
+            # Fallback for hand-built instances that only set root
+            extensions = [
+                ext
+                for ext in self.root.findall("extension")
+                # Skip the metadata extension (it's handled by template)
+                if ext.get("point") and ext.get("point") != "xbmc.addon.metadata"
+            ]
+        else:
             return ""
 
-        unknown_extensions = []
-        for ext in self.root.findall("extension"):
-            point = ext.get("point")
-            # Skip the metadata extension (it's handled by template)
-            if point and point != "xbmc.addon.metadata":
-                # Serialize this extension element as XML
-                xml_str = ET.tostring(ext, encoding="unicode")
-                unknown_extensions.append(xml_str)
-
-        return "".join(unknown_extensions)
+        # Serialize each extension element as XML, once; repeat callers get
+        # the memoized string
+        self._unknown_extensions_xml = "".join(ET.tostring(ext, encoding="unicode") for ext in extensions)
+        return self._unknown_extensions_xml
 
 
 def parse_addon_xml(addon_xml_path: Path) -> AddonXmlData:
@@ -107,38 +119,58 @@ def parse_addon_xml(addon_xml_path: Path) -> AddonXmlData:
     data.name = root.get("name")
     data.provider_name = root.get("provider-name")
 
-    # Parse metadata extension
-    metadata = root.find("extension[@point='xbmc.addon.metadata']")
+    # Walk the extensions once: locate the metadata extension and collect the
+    # unknown ones for later serialization in the same pass. A full streaming
+    # iterparse is not used because the whole tree must be retained anyway:
+    # the elements back get_unknown_extensions_xml().
+    metadata = None
+    unknown_extensions: list[ET.Element] = []
+    for ext in root.findall("extension"):
+        point = ext.get("point")
+        if point == "xbmc.addon.metadata":
+            if metadata is None:
+                metadata = ext
+        elif point:
+            unknown_extensions.append(ext)
+    data._unknown_extensions = unknown_extensions
+
+    # Parse metadata extension in a single pass over its children instead of
+    # one find/findall scan per field
     if metadata is not None:
-        # Simple text elements
-        for tag in ("summary", "description", "disclaimer", "license", "source"):
-            elem = metadata.find(tag)
-            if elem is not None and elem.text:
-                setattr(data, tag, elem.text)
-
-        # Assets
-        assets_elem = metadata.find("assets")
-        if assets_elem is not None:
-            for child in assets_elem:
-                if child.text:
-                    data.assets[child.tag] = child.text
-
-        # Requires
-        for req_elem in metadata.findall("requires"):
-            addon = req_elem.get("addon")
-            version = req_elem.get("version", "")
-            if addon:
-                data.requires.append({"addon": addon, "version": version})
-
-        # News
-        news_elem = metadata.find("news")
-        if news_elem is not None:
-            data.news = news_elem.text or ""
+        simple_tags = ("summary", "description", "disclaimer", "license", "source")
+        for child in metadata:
+            tag = child.tag
+            if tag in simple_tags:
+                # find() semantics: only the first occurrence of a tag counts
+                if child.text and getattr(data, tag) is None:
+                    setattr(data, tag, child.text)
+            elif tag == "assets":
+                for asset in child:
+                    if asset.text:
+                        data.assets[asset.tag] = asset.text
+            elif tag == "requires":
+                addon = child.get("addon")
+                if addon:
+                    data.requires.append({"addon": addon, "version": child.get("version", "")})
+            elif tag == "news" and data.news is None:
+                data.news = child.text or ""
 
     logger.info(f"Parsed addon.xml: id={data.id}, version={data.version}")
     return data
 
 
+@lru_cache(maxsize=None)
+def _version_key(version: str) -> tuple[int, ...]:
+    """Comparison key for dotted version strings.
+
+    Plain string comparison gets multi-digit components wrong
+    ("10.0.0" < "9.0.0"); comparing tuples of ints does not. Non-numeric
+    or empty components compare as 0 so malformed versions don't raise
+    during reconciliation.
+    """
+    return tuple(int(part) if part.isdigit() else 0 for part in version.split("."))
+
+
 def reconcile_requires(
     xml_requires: list[dict[str, str]],
     config_requires: list[dict[str, str]],
@@ -157,16 +189,15 @@ def reconcile_requires(
     Raises:
         ValueError: If strict mode and version conflict found
     """
-    requires_dict: dict[str, str] = {}
+    # Start with XML requires, built in one comprehension pass
+    requires_dict: dict[str, str] = {
+        addon: req.get("version", "") for req in xml_requires if (addon := req.get("addon"))
+    }
     warnings = []
 
-    # Start with XML requires
-    for req in xml_requires:
-        addon = req.get("addon")
-        if addon:
-            requires_dict[addon] = req.get("version", "")
-
-    # Overlay with config requires
+    # Overlay with config requires; log messages are coalesced after the loop
+    # so the handlers run once per category instead of once per entry
+    added = []
     for req in config_requires:
         addon = req.get("addon")
         if not addon:
@@ -183,18 +214,25 @@ def reconcile_requires(
                     logger.error(msg)
                     raise ValueError(msg)
                 else:
-                    # Choose higher version (simple string comparison for now)
-                    higher = max(xml_version, config_version)
+                    # Choose higher version by numeric component comparison
+                    if _version_key(config_version) > _version_key(xml_version):
+                        higher = config_version
+                    else:
+                        higher = xml_version
                     warning = (
                         f"addon {addon}: versions differ (xml={xml_version}, config={config_version}), using {higher}"
                     )
-                    logger.warning(warning)
                     warnings.append(warning)
                     requires_dict[addon] = higher
         else:
             # New addon from config
             requires_dict[addon] = config_version
-            logger.info(f"addon {addon}: added from config")
+            added.append(addon)
+
+    if warnings:
+        logger.warning("requires version conflicts:\n  " + "\n  ".join(warnings))
+    if added:
+        logger.info(f"addons added from config: {', '.join(added)}")
 
     # Convert back to list
     merged = [{"addon": k, "version": v} for k, v in sorted(requires_dict.items())]
@@ -242,8 +280,9 @@ def reconcile_addon(
     # Check for conflicts with XML (if it exists)
     if xml_data:
         for field in ("id", "name", "provider-name", "description"):
-            xml_val = getattr(xml_data, field.replace("-", "_"), None)
-            config_val = getattr(config, field.replace("-", "_"), None)
+            attr = field.replace("-", "_")
+            xml_val = getattr(xml_data, attr, None)
+            config_val = getattr(config, attr, None)
 
             if xml_val and config_val and xml_val != config_val:
                 if strict:
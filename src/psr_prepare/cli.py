@@ -4,13 +4,18 @@ import argparse
 import logging
 import sys
 from pathlib import Path
-
-from .addon import parse_addon_xml, reconcile_addon
-from .config import load_config
-from .templating import copy_addon_templates, copy_universal_templates
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Templates bundled with the psr_prepare package; resolved once at import
+# instead of rebuilding the Path chain on every run
+SOURCE_TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+# Parser construction is cached so repeated main() calls (tests, embedding)
+# pay for argparse setup once
+_parser: Optional[argparse.ArgumentParser] = None
+
 
 def setup_logging(debug: bool = False, quiet: bool = False) -> None:
     """Set up logging configuration.
@@ -31,12 +36,12 @@ def setup_logging(debug: bool = False, quiet: bool = False) -> None:
     )
 
 
-def main() -> int:
-    r"""Execute psr_prepare to prepare templates and configuration for PSR.
+def _build_parser() -> argparse.ArgumentParser:
+    """Build (or return the cached) argument parser."""
+    global _parser
+    if _parser is not None:
+        return _parser
 
-    Returns:
-        Exit code (0=success, 1=config error, 2=parse error, 3=reconciliation error)
-    """
     parser = argparse.ArgumentParser(
         description="Prepare templates and configuration for PSR (Python Semantic Release)",
         epilog="""
@@ -78,7 +83,24 @@ Examples:
         help="Suppress info-level logging (warnings and errors only)",
     )
 
-    args = parser.parse_args()
+    _parser = parser
+    return parser
+
+
+def main() -> int:
+    r"""Execute psr_prepare to prepare templates and configuration for PSR.
+
+    Returns:
+        Exit code (0=success, 1=config error, 2=parse error, 3=reconciliation error)
+    """
+    args = _build_parser().parse_args()
+
+    # Imported after argument parsing so --help and argparse errors return
+    # without loading the parsing/templating machinery
+    from .addon import parse_addon_xml, reconcile_addon
+    from .config import load_config
+    from .context import generate_context_injection
+    from .templating import copy_addon_templates, copy_universal_templates
 
     setup_logging(debug=args.debug, quiet=args.quiet)
 
@@ -94,7 +116,7 @@ Examples:
         context_dir = project_root / ".psr_context"
 
         # Templates are now bundled with psr_prepare package
-        source_templates_dir = Path(__file__).parent / "templates"
+        source_templates_dir = SOURCE_TEMPLATES_DIR
 
         logger.info(f"Project root: {project_root}")
         logger.info(f"Source templates: {source_templates_dir}")
@@ -138,11 +160,23 @@ Examples:
             if config.addon:
                 logger.info(f"[DRY RUN] Would copy addon templates to {templates_dir / config.addon.id}")
         else:
-            copy_universal_templates(source_templates_dir, templates_dir, addon_merged, news_types)
+            # Serialize the context once; both copy passes share the result
+            injection = generate_context_injection(addon_merged, news_types)
+
+            copy_universal_templates(
+                source_templates_dir, templates_dir, addon_merged, news_types, context_injection=injection
+            )
             logger.info(f"Universal templates copied to {templates_dir}")
 
             if config.addon:
-                copy_addon_templates(source_templates_dir, templates_dir, config.addon, addon_merged, news_types)
+                copy_addon_templates(
+                    source_templates_dir,
+                    templates_dir,
+                    config.addon,
+                    addon_merged,
+                    news_types,
+                    context_injection=injection,
+                )
                 logger.info(f"Addon templates copied to {templates_dir / config.addon.id}")
 
         # 7. Report warnings if any
@@ -7,10 +7,27 @@ from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Parsed configs keyed by (path, mtime_ns, size) so repeated loads of an
+# unchanged pyproject.toml skip the TOML parse and validation entirely
+_config_cache: dict[tuple[str, int, int], "PsrPrepareConfig"] = {}
+
 
 class AddonConfig:
     """Parsed addon configuration from [tool.psr-prepare.addon]."""
 
+    __slots__ = (
+        "id",
+        "name",
+        "provider_name",
+        "description",
+        "summary",
+        "license",
+        "disclaimer",
+        "source",
+        "assets",
+        "requires",
+    )
+
     def __init__(self, data: dict[str, Any]) -> None:
         """Initialize addon config from dictionary."""
         self.id: str = data.get("id", "")
@@ -35,6 +52,8 @@ class AddonConfig:
 class ChangelogConfig:
     """Parsed changelog configuration from [tool.psr-prepare.changelog]."""
 
+    __slots__ = ("file", "mode", "news_types")
+
     def __init__(self, data: dict[str, Any]) -> None:
         """Initialize changelog config from dictionary."""
         self.file: str = data.get("file", "CHANGELOG.md")
@@ -64,6 +83,8 @@ class ChangelogConfig:
 class PsrPrepareConfig:
     """Complete psr_prepare configuration."""
 
+    __slots__ = ("addon", "changelog")
+
     def __init__(self) -> None:
         """Initialize empty configuration."""
         self.addon: Optional[AddonConfig] = None
@@ -100,11 +121,20 @@ def load_config(config_path: Optional[Path] = None) -> PsrPrepareConfig:
     if not config_path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
+    # Cache hit: same file, same mtime and size — the previously built
+    # (and already validated) config is still current
+    stat = config_path.stat()
+    cache_key = (str(config_path), stat.st_mtime_ns, stat.st_size)
+    cached = _config_cache.get(cache_key)
+    if cached is not None:
+        logger.debug(f"Using cached configuration for {config_path}")
+        return cached
+
     logger.info(f"Loading configuration from {config_path}")
 
-    # Read and parse TOML
-    with open(config_path, "rb") as f:
-        pyproject = tomllib.load(f)
+    # Read and parse TOML; one read() call hands the parser a single
+    # contiguous buffer instead of iterating the file object
+    pyproject = tomllib.loads(config_path.read_bytes().decode("utf-8"))
 
     # Extract psr-prepare config
     tool_config = pyproject.get("tool", {})
@@ -130,4 +160,5 @@ def load_config(config_path: Optional[Path] = None) -> PsrPrepareConfig:
         raise ValueError(f"Configuration validation failed:\n{error_msg}")
 
     logger.info("Configuration valid")
+    _config_cache[cache_key] = config
     return config
@@ -4,6 +4,7 @@ import logging
 from pathlib import Path
 from typing import Optional
 
+from ._io import write_if_changed
 from .config import ChangelogConfig
 
 logger = logging.getLogger(__name__)
@@ -78,23 +79,28 @@ def write_addon_context(
         "unknown_extensions": addon_data.get("unknown_extensions", ""),
     }
 
-    # Generate Jinja2 variable definition
+    # Generate Jinja2 variable definition; write only when the content
+    # actually changed so incremental runs leave mtimes alone
     jinja_context_str = _python_to_jinja(context)
-    context_content = f"{{% set addon = {jinja_context_str} %}}\n"
+    context_bytes = f"{{% set addon = {jinja_context_str} %}}\n".encode("utf-8")
 
     # Write to universal templates directory if provided
     if universal_templates_dir:
         universal_templates_dir.mkdir(parents=True, exist_ok=True)
         universal_context = universal_templates_dir / ".psr-context.j2"
-        universal_context.write_text(context_content, encoding="utf-8")
-        logger.info(f"Wrote addon context to {universal_context}")
+        if write_if_changed(universal_context, context_bytes):
+            logger.info(f"Wrote addon context to {universal_context}")
+        else:
+            logger.debug(f"Addon context unchanged at {universal_context}")
 
     # Write to addon templates directory if provided
     if addon_templates_dir:
         addon_templates_dir.mkdir(parents=True, exist_ok=True)
         addon_context = addon_templates_dir / ".psr-context.j2"
-        addon_context.write_text(context_content, encoding="utf-8")
-        logger.info(f"Wrote addon context to {addon_context}")
+        if write_if_changed(addon_context, context_bytes):
+            logger.info(f"Wrote addon context to {addon_context}")
+        else:
+            logger.debug(f"Addon context unchanged at {addon_context}")
 
 
 def generate_context_injection(
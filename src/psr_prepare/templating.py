@@ -1,21 +1,87 @@
 """Template copying and mapping."""
 
 import logging
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
+from ._io import write_if_changed
 from .config import AddonConfig
 from .context import generate_context_injection
 
 logger = logging.getLogger(__name__)
 
 
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copy file contents and mtime without the full shutil.copy2 overhead.
+
+    Uses os.sendfile where available so the kernel moves the bytes directly
+    between descriptors; falls back to a buffered copy elsewhere. Only the
+    timestamps are carried over — copy2's chmod/xattr work is skipped since
+    templates are plain text files.
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        st = os.fstat(fsrc.fileno())
+        size = st.st_size
+        sent = 0
+        try:
+            while sent < size:
+                chunk = os.sendfile(fdst.fileno(), fsrc.fileno(), sent, size - sent)
+                if chunk == 0:
+                    # EOF before the fstat'd size (source shrank mid-copy);
+                    # stop rather than spin on zero-byte sends
+                    break
+                sent += chunk
+        except (AttributeError, OSError):
+            if sent == 0:
+                shutil.copyfileobj(fsrc, fdst, length=1 << 20)
+            else:
+                raise
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _iter_files(root: Path) -> Iterator[Path]:
+    """Yield every file under root using os.scandir.
+
+    DirEntry carries file-type information from the directory read itself,
+    so this avoids the extra stat syscall per entry that rglob("*") plus
+    is_file() incurs.
+    """
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield Path(entry.path)
+
+
+def _create_parent_dirs(files: list[Path], src_root: Path, dst_root: Path) -> None:
+    """Create target parent directories for files in one deduplicated pass.
+
+    Tracks directories already made so each unique directory costs one
+    mkdir call at most; deepest-first ordering lets mkdir(parents=True)
+    cover the ancestors of later entries for free.
+    """
+    parents = {dst_root / item.relative_to(src_root).parent for item in files}
+    made: set[Path] = set()
+    for parent in sorted(parents, key=lambda p: len(p.parts), reverse=True):
+        if parent in made:
+            continue
+        parent.mkdir(parents=True, exist_ok=True)
+        made.add(parent)
+        made.update(parent.parents)
+
+
 def copy_universal_templates(
     source_dir: Path,
     target_dir: Path,
     addon_data: Optional[dict[str, str]] = None,
     news_types: Optional[dict[str, str]] = None,
+    context_injection: Optional[str] = None,
 ) -> None:
     """Copy universal templates from source to target.
 
@@ -27,6 +93,8 @@ def copy_universal_templates(
         target_dir: Target directory (e.g., templates/)
         addon_data: Optional addon metadata to inject into templates
         news_types: Optional news type mappings to include in context
+        context_injection: Pre-built injection string; when provided, skips
+            regenerating it from addon_data/news_types
     """
     universal_src = source_dir / "universal"
 
@@ -36,27 +104,42 @@ def copy_universal_templates(
 
     target_dir.mkdir(parents=True, exist_ok=True)
 
-    # Generate context injection if addon_data provided
-    context_injection = generate_context_injection(addon_data, news_types)
-
-    for item in universal_src.rglob("*"):
-        if item.is_file():
-            rel_path = item.relative_to(universal_src)
-            target_file = target_dir / rel_path
-
-            target_file.parent.mkdir(parents=True, exist_ok=True)
-
-            # If it's a Jinja2 template and we have context, inject it at the top
-            if item.suffix == ".j2" and context_injection:
-                content = item.read_text(encoding="utf-8")
-                content_with_context = context_injection + content
-                target_file.write_text(content_with_context, encoding="utf-8")
-                logger.info(f"Copied universal/{rel_path} (with context injection)")
-            else:
-                shutil.copy2(item, target_file)
-                logger.info(f"Copied universal/{rel_path}")
+    # Generate context injection if addon_data provided; encode once so the
+    # per-file work is a bytes concatenation with no decode/encode roundtrip
+    if context_injection is None:
+        context_injection = generate_context_injection(addon_data, news_types)
+    injection_bytes = context_injection.encode("utf-8")
+
+    # Enumerate files once instead of re-walking per operation
+    files = list(_iter_files(universal_src))
+
+    # Create parent directories up front in one pass so the copy workers
+    # never race on mkdir
+    _create_parent_dirs(files, universal_src, target_dir)
+
+    def _copy_one(item: Path) -> None:
+        rel_path = item.relative_to(universal_src)
+        target_file = target_dir / rel_path
+
+        # If it's a Jinja2 template and we have context, inject it at the top
+        # (per-file messages use lazy %s formatting and only render at DEBUG)
+        if item.suffix == ".j2" and context_injection:
+            write_if_changed(target_file, injection_bytes + item.read_bytes())
+            logger.debug("Copied universal/%s (with context injection)", rel_path)
+        else:
+            _fast_copy(item, target_file)
+            logger.debug("Copied universal/%s", rel_path)
+
+    # The copies are independent and spend their time in GIL-releasing
+    # read/write syscalls; small trees stay serial to skip executor spin-up
+    if len(files) < 4:
+        for item in files:
+            _copy_one(item)
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+            list(executor.map(_copy_one, files))
 
-    logger.info(f"Universal templates copied to {target_dir}")
+    logger.info("Copied %d universal templates to %s", len(files), target_dir)
 
 
 def copy_addon_templates(
@@ -65,6 +148,7 @@ def copy_addon_templates(
     addon_config: AddonConfig,
     addon_data: Optional[dict[str, str]] = None,
     news_types: Optional[dict[str, str]] = None,
+    context_injection: Optional[str] = None,
 ) -> None:
     """Copy addon templates from source to target, organized by addon_id.
 
@@ -77,6 +161,8 @@ def copy_addon_templates(
         addon_config: Addon configuration with id
         addon_data: Optional addon metadata to inject into templates
         news_types: Optional news type mappings to include in context
+        context_injection: Pre-built injection string; when provided, skips
+            regenerating it from addon_data/news_types
     """
     addon_src = source_dir / "kodi-addons"
 
@@ -88,31 +174,47 @@ def copy_addon_templates(
     addon_target = target_dir / addon_id
     addon_target.mkdir(parents=True, exist_ok=True)
 
-    # Generate context injection if addon_data provided
-    context_injection = generate_context_injection(addon_data, news_types)
-
-    for item in addon_src.rglob("*"):
-        if item.is_file():
-            rel_path = item.relative_to(addon_src)
-            target_file = addon_target / rel_path
-            target_file.parent.mkdir(parents=True, exist_ok=True)
-
-            # If it's a Jinja2 template and we have context, inject it at the top
-            if item.suffix == ".j2" and context_injection:
-                content = item.read_text(encoding="utf-8")
-                content_with_context = context_injection + content
-                target_file.write_text(content_with_context, encoding="utf-8")
-                logger.info(f"Copied kodi-addons/{rel_path} → {addon_id}/{rel_path} (with context injection)")
-            else:
-                shutil.copy2(item, target_file)
-                logger.info(f"Copied kodi-addons/{rel_path} → {addon_id}/{rel_path}")
+    # Generate context injection if addon_data provided; encode once so the
+    # per-file work is a bytes concatenation with no decode/encode roundtrip
+    if context_injection is None:
+        context_injection = generate_context_injection(addon_data, news_types)
+    injection_bytes = context_injection.encode("utf-8")
+
+    # Enumerate files once instead of re-walking per operation
+    files = list(_iter_files(addon_src))
+
+    # Create parent directories up front in one pass so the copy workers
+    # never race on mkdir
+    _create_parent_dirs(files, addon_src, addon_target)
+
+    def _copy_one(item: Path) -> None:
+        rel_path = item.relative_to(addon_src)
+        target_file = addon_target / rel_path
+
+        # If it's a Jinja2 template and we have context, inject it at the top
+        # (per-file messages use lazy %s formatting and only render at DEBUG)
+        if item.suffix == ".j2" and context_injection:
+            write_if_changed(target_file, injection_bytes + item.read_bytes())
+            logger.debug("Copied kodi-addons/%s → %s/%s (with context injection)", rel_path, addon_id, rel_path)
+        else:
+            _fast_copy(item, target_file)
+            logger.debug("Copied kodi-addons/%s → %s/%s", rel_path, addon_id, rel_path)
+
+    # The copies are independent and spend their time in GIL-releasing
+    # read/write syscalls; small trees stay serial to skip executor spin-up
+    if len(files) < 4:
+        for item in files:
+            _copy_one(item)
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+            list(executor.map(_copy_one, files))
 
     # Ensure addon.xml.j2 has news placeholder
     addon_xml_template = addon_target / "addon.xml.j2"
     if addon_xml_template.exists():
         ensure_news_placeholder(addon_xml_template)
 
-    logger.info(f"Addon templates copied to {addon_target}")
+    logger.info("Copied %d addon templates to %s", len(files), addon_target)
 
 
 def ensure_news_placeholder(addon_xml_template: Path) -> None:
@@ -124,16 +226,22 @@ def ensure_news_placeholder(addon_xml_template: Path) -> None:
     Args:
         addon_xml_template: Path to addon.xml.j2 template
     """
-    content = addon_xml_template.read_text()
+    # Probe the raw bytes first so the common idempotent-rerun path skips
+    # the UTF-8 decode entirely
+    content_bytes = addon_xml_template.read_bytes()
 
     # Check if news placeholder already exists
-    if "<news>" in content:
+    if b"<news>" in content_bytes:
         logger.info("addon.xml.j2 already has news placeholder")
         return
 
+    content = content_bytes.decode("utf-8")
+
     # Try to parse as XML-like to find insertion point
-    # (templates have Jinja2 so we can't parse as pure XML)
-    metadata_idx = content.find("</extension>")
+    # (templates have Jinja2 so we can't parse as pure XML).
+    # The metadata extension closes last in addon.xml.j2, so scanning from
+    # the end finds it without walking the whole file
+    metadata_idx = content.rfind("</extension>")
 
     if metadata_idx != -1:
         # Insert before closing extension tag
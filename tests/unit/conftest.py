@@ -13,13 +13,13 @@ import pytest
 @pytest.fixture
 def mock_template_file(mocker):
     """
-    Create a mock template file with read_text() method.
+    Create a mock template file with read_bytes() method.
 
     Returns:
-        MagicMock: Mock template file that returns "template content" on read_text().
+        MagicMock: Mock template file that returns b"template content" on read_bytes().
     """
     mock_file = MagicMock()
-    mock_file.read_text.return_value = "template content"
+    mock_file.read_bytes.return_value = b"template content"
     return mock_file
 
 
@@ -48,7 +48,10 @@ def mock_fixture_dir(mocker):
     mock_dst.exists.return_value = False
     mock_dst.is_symlink.return_value = False
     mock_dst.parent.mkdir = mocker.MagicMock()
-    mock_dst.write_text = mocker.MagicMock()
+    mock_dst.write_bytes = mocker.MagicMock()
+    # Atomic writes stage through dst.with_name(...); route the temporary
+    # path back to the same mock so write assertions see the content
+    mock_dst.with_name.return_value = mock_dst
 
     return fixture_dir, fixture_dir_resolved, mock_dst
 
@@ -79,7 +82,7 @@ def mock_arrangeable_template(mocker, mock_templates_package, mock_template_file
     Sets up the full chain:
     - importlib.resources.files() returned
     - Mock files / template_path -> mock template file
-    - mock template file.read_text() -> "template content"
+    - mock template file.read_bytes() -> b"template content"
 
     Returns:
         Tuple[MagicMock, MagicMock, MagicMock]: (mock_files, mock_root, mock_template)
@@ -89,7 +92,7 @@ def mock_arrangeable_template(mocker, mock_templates_package, mock_template_file
     return mock_files, mock_root, mock_template_file
 
 
-def setup_fixture_and_templates_mocks(mocker, fixture_dir_mock=None, template_content="template content"):
+def setup_fixture_and_templates_mocks(mocker, fixture_dir_mock=None, template_content=b"template content"):
     """
     Setup both fixture directory and templates package mocks together.
 
@@ -98,7 +101,7 @@ def setup_fixture_and_templates_mocks(mocker, fixture_dir_mock=None, template_co
     Args:
         mocker: pytest-mock fixture
         fixture_dir_mock: Optional pre-configured fixture dir mock. If None, creates new one.
-        template_content: Content to return from template file read_text()
+        template_content: Bytes to return from template file read_bytes()
 
     Returns:
         Dict with keys: fixture_dir, fixture_dir_resolved, mock_dst, mock_files, mock_root
@@ -115,13 +118,16 @@ def setup_fixture_and_templates_mocks(mocker, fixture_dir_mock=None, template_co
     mock_dst.exists.return_value = False
     mock_dst.is_symlink.return_value = False
     mock_dst.parent.mkdir = mocker.MagicMock()
-    mock_dst.write_text = mocker.MagicMock()
+    mock_dst.write_bytes = mocker.MagicMock()
+    # Atomic writes stage through dst.with_name(...); route the temporary
+    # path back to the same mock so write assertions see the content
+    mock_dst.with_name.return_value = mock_dst
 
     # Setup templates package
     mock_files = mocker.patch("importlib.resources.files")
     mock_root = mocker.MagicMock()
     mock_template = mocker.MagicMock()
-    mock_template.read_text.return_value = template_content
+    mock_template.read_bytes.return_value = template_content
 
     mock_root.__truediv__.return_value = mock_template
     mock_files.return_value = mock_root
@@ -18,8 +18,8 @@ class TestLoadConfig:
     def test_load_config_success(self, mocker):
         """Test loading config from pyproject.toml."""
         mock_data = {"tool": {"arranger": {"key": "value"}}}
-        mocker.patch("tomllib.load", return_value=mock_data)
-        mocker.patch("builtins.open", mock_open())
+        mocker.patch("tomllib.loads", return_value=mock_data)
+        mocker.patch("builtins.open", mock_open(read_data=b"[tool.arranger]\n"))
         mocker.patch("pathlib.Path.exists", return_value=True)
 
         result = load_config(Path("dummy.toml"))
@@ -33,8 +33,8 @@ class TestLoadConfig:
     def test_load_config_no_tool_section(self, mocker):
         """Test loading config when [tool] section is missing."""
         mock_data = {"project": {}}
-        mocker.patch("tomllib.load", return_value=mock_data)
-        mocker.patch("builtins.open", mock_open())
+        mocker.patch("tomllib.loads", return_value=mock_data)
+        mocker.patch("builtins.open", mock_open(read_data=b"[tool.arranger]\n"))
         mocker.patch("pathlib.Path.exists", return_value=True)
 
         result = load_config(Path("dummy.toml"))
@@ -47,8 +47,8 @@ class TestLoadConfig:
     def test_load_config_no_arranger_section(self, mocker):
         """Test loading config when [tool.arranger] section is missing."""
         mock_data = {"tool": {"other": {}}}
-        mocker.patch("tomllib.load", return_value=mock_data)
-        mocker.patch("builtins.open", mock_open())
+        mocker.patch("tomllib.loads", return_value=mock_data)
+        mocker.patch("builtins.open", mock_open(read_data=b"[tool.arranger]\n"))
         mocker.patch("pathlib.Path.exists", return_value=True)
 
         result = load_config(Path("dummy.toml"))
@@ -70,8 +70,8 @@ class TestLoadConfig:
     def test_load_config_malformed_toml(self, mocker):
         """Test error handling for malformed TOML syntax (E1.3)."""
         mocker.patch("pathlib.Path.exists", return_value=True)
-        mocker.patch("builtins.open", mock_open())
-        mocker.patch("tomllib.load", side_effect=ValueError("Invalid TOML syntax at line 1"))
+        mocker.patch("builtins.open", mock_open(read_data=b"[tool.arranger]\n"))
+        mocker.patch("tomllib.loads", side_effect=ValueError("Invalid TOML syntax at line 1"))
 
         with pytest.raises(ValueError) as exc_info:
             load_config(Path("bad.toml"))
@@ -90,8 +90,8 @@ class TestLoadConfig:
                 }
             }
         }
-        mocker.patch("tomllib.load", return_value=mock_data)
-        mocker.patch("builtins.open", mock_open())
+        mocker.patch("tomllib.loads", return_value=mock_data)
+        mocker.patch("builtins.open", mock_open(read_data=b"[tool.arranger]\n"))
         mocker.patch("pathlib.Path.exists", return_value=True)
 
         load_config(Path("dummy.toml"))
@@ -102,6 +102,64 @@ class TestLoadConfig:
         assert "another-bad-key" in captured.err
 
 
+class TestLoadConfigCache:
+    """Tests for the mtime/size-keyed config cache (warm-run fast path)."""
+
+    def test_load_config_writes_cache_file(self, tmp_path):
+        """Test that a successful parse writes a cache next to the TOML file."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('[tool.arranger]\n"templates-dir" = "templates"\n')
+
+        result = load_config(pyproject)
+
+        assert result["templates-dir"] == "templates"
+        assert pyproject.with_suffix(".toml.cache").exists()
+
+    def test_load_config_cache_hit_skips_parse(self, mocker, tmp_path):
+        """Test that a valid cache is used without re-parsing the TOML."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('[tool.arranger]\n"templates-dir" = "templates"\n')
+
+        first = load_config(pyproject)
+
+        # A second call must not reach the TOML parser
+        mocker.patch("tomllib.loads", side_effect=AssertionError("cache miss"))
+        second = load_config(pyproject)
+
+        assert second == first
+
+    def test_load_config_cache_invalidated_on_change(self, tmp_path):
+        """Test that modifying pyproject.toml invalidates the cache."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('[tool.arranger]\n"templates-dir" = "templates"\n')
+        load_config(pyproject)
+
+        pyproject.write_text('[tool.arranger]\n"templates-dir" = "changed-templates"\n')
+        result = load_config(pyproject)
+
+        assert result["templates-dir"] == "changed-templates"
+
+    def test_load_config_corrupt_cache_falls_back(self, tmp_path):
+        """Test that an unreadable cache falls back to parsing the TOML."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('[tool.arranger]\n"templates-dir" = "templates"\n')
+        pyproject.with_suffix(".toml.cache").write_bytes(b"not valid json")
+
+        result = load_config(pyproject)
+
+        assert result["templates-dir"] == "templates"
+
+    def test_load_config_skips_parse_without_arranger_section(self, mocker, tmp_path):
+        """Test that a pyproject.toml not mentioning arranger skips the TOML parse."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('[tool.other]\nname = "example"\n')
+
+        mocker.patch("tomllib.loads", side_effect=AssertionError("parsed anyway"))
+        result = load_config(pyproject)
+
+        assert result == {"source-mappings": {}}
+
+
 class TestArrangeTemplates:
     def test_arrange_templates_places_files(self, mocker):
         """Test that arrange_templates places templates."""
@@ -113,7 +171,7 @@ class TestArrangeTemplates:
         mocks["fixture_dir_resolved"].__truediv__.assert_called_with("CHANGELOG.md")
         mocks["mock_files"].assert_called_once_with("arranger.templates")
         mocks["mock_root"].__truediv__.assert_called_with("universal/CHANGELOG.md.j2")
-        mocks["mock_dst"].write_text.assert_called_once_with("template content", encoding="utf-8")
+        mocks["mock_dst"].write_bytes.assert_called_once_with(b"template content")
 
     def test_arrange_templates_multiple_files(self, mocker):
         """Test placing multiple files."""
@@ -127,7 +185,20 @@ class TestArrangeTemplates:
 
         assert mocks["fixture_dir_resolved"].__truediv__.call_count == 2
         assert mocks["mock_files"].call_count == 1
-        assert mocks["mock_dst"].write_text.call_count == 2
+        assert mocks["mock_dst"].write_bytes.call_count == 2
+
+    def test_arrange_templates_shared_source_read_once(self, mocker):
+        """Test a template mapped to several destinations is read only once."""
+        mocks = setup_fixture_and_templates_mocks(mocker)
+
+        mappings = {
+            "docs/CHANGELOG.md": "universal/CHANGELOG.md.j2",
+            "other/CHANGELOG.md": "universal/CHANGELOG.md.j2",
+        }
+        arrange_templates(mocks["fixture_dir"], mappings)
+
+        assert mocks["mock_template"].read_bytes.call_count == 1
+        assert mocks["mock_dst"].write_bytes.call_count == 2
 
     def test_arrange_templates_file_exists_overwrites(self, mocker):
         """Test arrange_templates overwrites if file exists."""
@@ -137,7 +208,7 @@ class TestArrangeTemplates:
         mappings = {"CHANGELOG.md": "universal/CHANGELOG.md.j2"}
         arrange_templates(mocks["fixture_dir"], mappings, override=True)
 
-        mocks["mock_dst"].write_text.assert_called_once()
+        mocks["mock_dst"].write_bytes.assert_called_once()
 
     def test_arrange_templates_missing_source(self, mocker, tmp_path):
         """Test error handling when template file doesn't exist (E1.1)."""
@@ -145,11 +216,11 @@ class TestArrangeTemplates:
         mock_files = mocker.patch("importlib.resources.files")
         mock_template_dir = mocker.MagicMock()
 
-        # Create a mock that raises FileNotFoundError when read_text is called
+        # Create a mock that raises FileNotFoundError when read_bytes is called
         mock_template_file = mocker.MagicMock()
-        mock_template_file.read_text.side_effect = FileNotFoundError("No such file")
+        mock_template_file.read_bytes.side_effect = FileNotFoundError("No such file")
 
-        # Set up the chain: files() / template_path -> raises error on read_text()
+        # Set up the chain: files() / template_path -> raises error on read_bytes()
         mock_template_dir.__truediv__ = mocker.MagicMock(return_value=mock_template_file)
         mock_files.return_value = mock_template_dir
 
@@ -163,6 +234,30 @@ class TestArrangeTemplates:
         assert "Template file not found" in str(exc_info.value)
         assert "missing.j2" in str(exc_info.value)
 
+    def test_arrange_templates_skips_write_when_content_unchanged(self, mocker):
+        """Test that a destination already holding the content is not rewritten."""
+        mocks = setup_fixture_and_templates_mocks(mocker)
+        mocks["mock_dst"].read_bytes.return_value = b"template content"
+
+        mappings = {"CHANGELOG.md": "universal/CHANGELOG.md.j2"}
+        arrange_templates(mocks["fixture_dir"], mappings)
+
+        mocks["mock_dst"].write_bytes.assert_not_called()
+
+    def test_arrange_templates_validates_sources_before_writing(self, mocker):
+        """Test that a missing template source fails before any file is written."""
+        mocks = setup_fixture_and_templates_mocks(mocker)
+        mocks["mock_template"].is_file.return_value = False
+
+        mappings = {"dest.txt": "missing.j2"}
+
+        with pytest.raises(FileNotFoundError) as exc_info:
+            arrange_templates(mocks["fixture_dir"], mappings)
+
+        assert "Template file not found" in str(exc_info.value)
+        assert "missing.j2" in str(exc_info.value)
+        mocks["mock_dst"].write_bytes.assert_not_called()
+
     def test_arrange_templates_import_error(self, mocker, tmp_path):
         """Test error handling when template package cannot be imported (E1.4)."""
         mocker.patch(
@@ -185,8 +280,8 @@ class TestArrangeTemplates:
         """Test error handling for permission denied when writing (E1.5)."""
         mock_files = mocker.patch("importlib.resources.files")
         mock_template_file = mocker.MagicMock()
-        mock_template_file.read_text.return_value = "content"
-        # Create a div operation that returns a MagicMock with read_text
+        mock_template_file.read_bytes.return_value = b"content"
+        # Create a div operation that returns a MagicMock with read_bytes
         mock_template_file.__truediv__ = mocker.MagicMock(return_value=mock_template_file)
         mock_files.return_value = mock_template_file
 
@@ -200,7 +295,8 @@ class TestArrangeTemplates:
         mock_path.parent = mocker.MagicMock(spec=Path)
         mock_path.parent.mkdir = mocker.MagicMock()
         mock_path.exists.return_value = False
-        mock_path.write_text.side_effect = PermissionError("Access denied")
+        mock_path.write_bytes.side_effect = PermissionError("Access denied")
+        mock_path.with_name.return_value = mock_path
 
         mocker.patch.object(Path, "__truediv__", return_value=mock_path)
 
@@ -398,7 +494,7 @@ class TestArrangeTemplatesPhase2:
         """Test E1.10: arrange_templates creates missing fixture directory."""
         mock_files = mocker.patch("importlib.resources.files")
         mock_template = mocker.MagicMock()
-        mock_template.read_text.return_value = "content"
+        mock_template.read_bytes.return_value = b"content"
         mock_files.return_value = mocker.MagicMock(__truediv__=mocker.MagicMock(return_value=mock_template))
 
         fixture_dir = tmp_path / "new_dir"  # Directory doesn't exist yet
@@ -411,6 +507,24 @@ class TestArrangeTemplatesPhase2:
         assert fixture_dir.exists()
         assert (fixture_dir / "dest" / "file.txt").exists()
 
+    def test_arrange_templates_shared_parent_dirs_created_once(self, mocker, tmp_path):
+        """Test destination directories with shared ancestors are precreated once."""
+        mock_files = mocker.patch("importlib.resources.files")
+        mock_template = mocker.MagicMock()
+        mock_template.read_bytes.return_value = b"content"
+        mock_files.return_value = mocker.MagicMock(__truediv__=mocker.MagicMock(return_value=mock_template))
+
+        fixture_dir = tmp_path / "fixture"
+        mappings = {
+            "nested/deep/one.txt": "template.j2",
+            "nested/deep/leaf/two.txt": "template.j2",
+            "nested/three.txt": "template.j2",
+        }
+        arrange_templates(fixture_dir, mappings)
+
+        for dest in mappings:
+            assert (fixture_dir / dest).exists()
+
     def test_arrange_templates_empty_mappings_error(self, mocker, tmp_path):
         """Test E1.10: arrange_templates rejects empty mappings."""
         fixture_dir = tmp_path / "fixture"
@@ -426,7 +540,7 @@ class TestArrangeTemplatesPhase2:
         """Test E1.9: override=False prevents file overwrite."""
         mock_files = mocker.patch("importlib.resources.files")
         mock_template = mocker.MagicMock()
-        mock_template.read_text.return_value = "new content"
+        mock_template.read_bytes.return_value = b"new content"
         mock_files.return_value = mocker.MagicMock(__truediv__=mocker.MagicMock(return_value=mock_template))
 
         fixture_dir = tmp_path / "fixture"
@@ -449,7 +563,7 @@ class TestArrangeTemplatesPhase2:
         """Test E1.9: override=True allows file overwrite."""
         mock_files = mocker.patch("importlib.resources.files")
         mock_template = mocker.MagicMock()
-        mock_template.read_text.return_value = "new content"
+        mock_template.read_bytes.return_value = b"new content"
         mock_files.return_value = mocker.MagicMock(__truediv__=mocker.MagicMock(return_value=mock_template))
 
         fixture_dir = tmp_path / "fixture"
@@ -470,7 +584,7 @@ class TestArrangeTemplatesPhase2:
         """Test E1.11: arrange_templates removes symlinks when override=True."""
         mock_files = mocker.patch("importlib.resources.files")
         mock_template = mocker.MagicMock()
-        mock_template.read_text.return_value = "new content"
+        mock_template.read_bytes.return_value = b"new content"
         mock_files.return_value = mocker.MagicMock(__truediv__=mocker.MagicMock(return_value=mock_template))
 
         fixture_dir = tmp_path / "fixture"
@@ -497,7 +611,7 @@ class TestArrangeTemplatesPhase2:
         """Test E1.11: arrange_templates rejects symlinks when override=False."""
         mock_files = mocker.patch("importlib.resources.files")
         mock_template = mocker.MagicMock()
-        mock_template.read_text.return_value = "new content"
+        mock_template.read_bytes.return_value = b"new content"
         mock_files.return_value = mocker.MagicMock(__truediv__=mocker.MagicMock(return_value=mock_template))
 
         fixture_dir = tmp_path / "fixture"
@@ -532,7 +646,7 @@ class TestArrangeTemplatesPhase2:
         mock_files = mocker.patch("importlib.resources.files")
         mock_template = mocker.MagicMock()
         # Template with unicode characters
-        mock_template.read_text.return_value = "# Changelog\n✓ Done\n© Copyright"
+        mock_template.read_bytes.return_value = "# Changelog\n✓ Done\n© Copyright".encode("utf-8")
         mock_files.return_value = mocker.MagicMock(__truediv__=mocker.MagicMock(return_value=mock_template))
 
         fixture_dir = tmp_path / "fixture"
@@ -721,13 +835,13 @@ class TestPhase5Coverage:
     def test_load_config_toml_decode_error(self, mocker):
         """Test error handling for TOMLDecodeError (E1.3 specific decoder error)."""
         mocker.patch("pathlib.Path.exists", return_value=True)
-        mocker.patch("builtins.open", mock_open())
+        mocker.patch("builtins.open", mock_open(read_data=b"[tool.arranger]\n"))
 
         # Create a mock exception that looks like TOMLDecodeError
         import tomllib
 
         original_error = tomllib.TOMLDecodeError("error msg", "doc", 0)
-        mocker.patch("tomllib.load", side_effect=original_error)
+        mocker.patch("tomllib.loads", side_effect=original_error)
 
         with pytest.raises(ValueError, match="Invalid TOML"):
             load_config(Path("bad.toml"))
@@ -861,8 +975,8 @@ class TestPhase5Coverage:
         """Test error when template path points to directory (IsADirectoryError)."""
         mock_files = mocker.patch("importlib.resources.files")
         mock_template = mocker.MagicMock()
-        # Raise IsADirectoryError when read_text is called
-        mock_template.read_text.side_effect = IsADirectoryError("Is a directory")
+        # Raise IsADirectoryError when read_bytes is called
+        mock_template.read_bytes.side_effect = IsADirectoryError("Is a directory")
 
         mock_root = mocker.MagicMock()
         mock_root.__truediv__.return_value = mock_template
@@ -879,7 +993,7 @@ class TestPhase5Coverage:
         """Test permission error when creating destination directories."""
         mock_files = mocker.patch("importlib.resources.files")
         mock_template = mocker.MagicMock()
-        mock_template.read_text.return_value = "content"
+        mock_template.read_bytes.return_value = b"content"
 
         mock_root = mocker.MagicMock()
         mock_root.__truediv__.return_value = mock_template
@@ -1043,15 +1157,41 @@ class TestPhase5Coverage:
         with pytest.raises(PermissionError, match="Permission denied removing symlink"):
             _handle_existing_destination(dst, override=True)
 
-    def test_write_destination_file_unicode_error(self, mocker):
-        """Test _write_destination_file handles UnicodeEncodeError."""
+    def test_write_destination_file_exclusive_create(self, tmp_path):
+        """Test override=False uses exclusive create and rejects races."""
+        from arranger.run import _write_destination_file
+
+        dst = tmp_path / "file.txt"
+        _write_destination_file(dst, b"first", override=False)
+        assert dst.read_bytes() == b"first"
+
+        # A file that appeared concurrently must never be clobbered
+        with pytest.raises(FileExistsError, match="--override"):
+            _write_destination_file(dst, b"second", override=False)
+        assert dst.read_bytes() == b"first"
+
+    def test_write_destination_file_atomic_override(self, tmp_path):
+        """Test override writes land via rename and leave no temp files."""
+        from arranger.run import _write_destination_file
+
+        dst = tmp_path / "file.txt"
+        dst.write_bytes(b"old")
+        _write_destination_file(dst, b"new", override=True)
+
+        assert dst.read_bytes() == b"new"
+        assert list(tmp_path.iterdir()) == [dst]
+
+    def test_write_destination_file_writes_bytes_verbatim(self, mocker):
+        """Test _write_destination_file copies UTF-8 bytes without re-encoding."""
         from arranger.run import _write_destination_file
 
         dst = mocker.MagicMock()
-        dst.write_text.side_effect = UnicodeEncodeError("utf-8", "test", 0, 1, "test error")
+        dst.with_name.return_value = dst
+        content = "# Changelog\n✓ Done\n".encode("utf-8")
+
+        _write_destination_file(dst, content)
 
-        with pytest.raises(ValueError, match="File encoding error"):
-            _write_destination_file(dst, "problematic content")
+        dst.write_bytes.assert_called_once_with(content)
 
     def test_main_unexpected_exception_handling(self, mocker):
         """Test main() handles unexpected exceptions."""
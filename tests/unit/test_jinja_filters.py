@@ -0,0 +1,76 @@
+"""Unit tests for arranger custom Jinja2 filters."""
+
+import pytest
+
+from arranger.jinja_filters import FILTERS, file_exists, read_file, read_file_or_empty
+
+
+class TestReadFile:
+    def test_read_file_returns_contents(self, tmp_path):
+        """Test read_file returns file contents."""
+        target = tmp_path / "news.txt"
+        target.write_text("release notes")
+
+        assert read_file(target) == "release notes"
+
+    def test_read_file_missing_raises(self, tmp_path):
+        """Test read_file raises FileNotFoundError for missing files."""
+        with pytest.raises(FileNotFoundError):
+            read_file(tmp_path / "missing.txt")
+
+    def test_read_file_cache_invalidated_on_change(self, tmp_path):
+        """Test cached contents are refreshed when the file changes."""
+        target = tmp_path / "news.txt"
+        target.write_text("first")
+        assert read_file(target) == "first"
+
+        target.write_text("second-longer")
+        assert read_file(target) == "second-longer"
+
+    def test_read_file_repeated_reads_served_from_cache(self, mocker, tmp_path):
+        """Test a second read of an unchanged file skips the file read."""
+        target = tmp_path / "news.txt"
+        target.write_text("cached")
+        assert read_file(target) == "cached"
+
+        mocker.patch("builtins.open", side_effect=AssertionError("cache miss"))
+        assert read_file(target) == "cached"
+
+
+class TestReadFileOrEmpty:
+    def test_read_file_or_empty_returns_contents(self, tmp_path):
+        """Test read_file_or_empty returns file contents when present."""
+        target = tmp_path / "news.txt"
+        target.write_text("release notes")
+
+        assert read_file_or_empty(target) == "release notes"
+
+    def test_read_file_or_empty_missing_returns_empty(self, tmp_path):
+        """Test read_file_or_empty returns empty string for missing files."""
+        assert read_file_or_empty(tmp_path / "missing.txt") == ""
+
+
+class TestFileExists:
+    def test_file_exists_true(self, tmp_path):
+        """Test file_exists returns True for existing files."""
+        target = tmp_path / "present.txt"
+        target.write_text("x")
+
+        assert file_exists(target) is True
+
+    def test_file_exists_false(self, tmp_path):
+        """Test file_exists returns False for missing files."""
+        assert file_exists(tmp_path / "missing.txt") is False
+
+
+class TestFiltersRegistry:
+    def test_filters_dict_exposes_all_filters(self):
+        """Test the FILTERS registry maps names to the filter callables."""
+        assert FILTERS["read_file"] is read_file
+        assert FILTERS["read_file_or_empty"] is read_file_or_empty
+        assert FILTERS["file_exists"] is file_exists
+
+    def test_filters_registry_is_read_only(self):
+        """Test the shared FILTERS registry cannot be mutated."""
+        with pytest.raises(TypeError):
+            FILTERS["read_file"] = lambda p: ""  # type: ignore[index]
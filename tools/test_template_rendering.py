@@ -25,6 +25,10 @@ from jinja2 import Environment, FileSystemLoader  # noqa: E402
 # Import custom Jinja2 filters from arranger package
 from arranger.jinja_filters import FILTERS as JINJA_FILTERS  # noqa: E402
 
+# First "## vX.Y.Z" heading in an existing changelog; compiled once instead of
+# per rendered version
+VERSION_HEADING_RE = re.compile(r"^## v\d+\.\d+\.\d+", re.MULTILINE)
+
 
 def run_git(cmd: Union[str, list[str]], cwd: Path) -> str:
     """Run git command. cmd can be a string or list."""
@@ -136,6 +140,16 @@ def render_templates(releases: dict[str, Any], output_dir: Path) -> None:
     # Use filters from arranger package (read_file, read_file_or_empty, file_exists)
     # Note: these are also registered globally via arranger.__init__ monkey-patching
 
+    # Build each Jinja environment (and compile its template) once; only the
+    # render context changes between versions
+    addon_env = Environment(loader=FileSystemLoader(templates_dir / "kodi-addons"))
+    addon_env.filters.update(JINJA_FILTERS)  # Register all custom filters
+    addon_template = addon_env.get_template("addon.xml.j2")
+
+    changelog_env = Environment(loader=FileSystemLoader(templates_dir / "universal"))
+    changelog_env.filters.update(JINJA_FILTERS)  # Register all custom filters
+    changelog_template = changelog_env.get_template("CHANGELOG.md.j2")
+
     # Sort versions to render in order (0.1.0, then 0.2.0, etc.)
     sorted_versions = sorted(releases.keys(), key=lambda v: tuple(map(int, v.split("."))))
 
@@ -213,9 +227,6 @@ def render_templates(releases: dict[str, Any], output_dir: Path) -> None:
         )
 
         # Render addon.xml.j2
-        env = Environment(loader=FileSystemLoader(templates_dir / "kodi-addons"))
-        env.filters.update(JINJA_FILTERS)  # Register all custom filters
-        addon_template = env.get_template("addon.xml.j2")
         addon_output = addon_template.render(ctx=ctx)
 
         # For update mode: merge with existing addon.xml at <news> insertion point
@@ -242,9 +253,6 @@ def render_templates(releases: dict[str, Any], output_dir: Path) -> None:
         print(f"✓ Rendered addon.xml for v{version}")
 
         # Render CHANGELOG.md.j2
-        env = Environment(loader=FileSystemLoader(templates_dir / "universal"))
-        env.filters.update(JINJA_FILTERS)  # Register all custom filters
-        changelog_template = env.get_template("CHANGELOG.md.j2")
         changelog_output = changelog_template.render(ctx=ctx)
 
         # For update mode: merge with newest first
@@ -263,7 +271,7 @@ def render_templates(releases: dict[str, Any], output_dir: Path) -> None:
                 release_section = release_section.replace(insertion_flag, "").strip()
 
                 # Find the position to insert: before the first ## vX.Y.Z in existing file
-                first_version_match = re.search(r"^## v\d+\.\d+\.\d+", existing_changelog, re.MULTILINE)
+                first_version_match = VERSION_HEADING_RE.search(existing_changelog)
                 if first_version_match:
                     insert_pos = first_version_match.start()
                     # Insert before the first version heading